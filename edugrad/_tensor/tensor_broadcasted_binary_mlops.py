@@ -8,6 +8,8 @@ from __future__ import annotations
 import math
 
 from edugrad.dtypes import dtypes
+from edugrad.data import TensorData
+from edugrad.ops import LoadOps
 import edugrad.function as function
 
 
@@ -26,6 +28,11 @@ def _broadcasted(tensor: Tensor, y: Tensor | float, reverse: bool = False) -> tu
         tuple[Tensor, Tensor]: A tuple of two tensors broadcasted to a common shape.
 
     """
+    # Fast path for operands that already have the same shape, which is the most common case in training loops. It
+    # comes before the import because that runs on every call.
+    if y.__class__ is tensor.__class__ and y.shape == tensor.shape:
+        return (y, tensor) if reverse else (tensor, y)
+
     from edugrad.tensor import Tensor
 
     x: Tensor = tensor
@@ -34,7 +41,14 @@ def _broadcasted(tensor: Tensor, y: Tensor | float, reverse: bool = False) -> tu
     if not isinstance(y, Tensor):
         if 0 in x.shape:
             return x, x.full_like(y)
-        y = Tensor(y, requires_grad=False, dtype=tensor.dtype if tensor.dtype != dtypes.bool else dtypes.float32)
+        dtype = tensor.dtype if tensor.dtype != dtypes.bool else dtypes.float32
+        if isinstance(y, (bool, int, float)):
+            # Python scalars become a constant of the input's shape directly from TensorData, so they need neither the
+            # __init__ dispatch nor reshape and expand nodes in the graph
+            const = TensorData.loadop(LoadOps.CONST, tuple(), dtype, y).expand(x.shape)
+            y = Tensor._from_data(const, requires_grad=False)
+        else:
+            y = Tensor(y, requires_grad=False, dtype=dtype)
 
     # Swap tensors if reverse is True.
     if reverse:
@@ -5,6 +5,8 @@ Conceptual explanations: https://www.tobiasstenzel.com/blog/2023/dl-backprop/
 """
 from __future__ import annotations
 
+from edugrad.ops import BinaryOps
+
 
 def collect_backward_graph(tensor: Tensor):
     """Collects tensors involved in the computational graph of the given tensor in backward pass order.
@@ -35,7 +37,7 @@ def collect_backward_graph(tensor: Tensor):
 
     def depth_first_search(node: Tensor, visited: set, nodes: list[Tensor]):
         visited.add(node)
-        if getattr(node, "_ctx", None):
+        if node._ctx is not None:
             # Visit each parent recursively. Parents are tensors that contributed to creating 'node' in forward pass.
             for parent in node._ctx.parents:
                 if parent not in visited:
@@ -99,8 +101,9 @@ def backward(tensor: Tensor) -> Tensor:
 
         # Compute gradients for the current tensor
         grads = t0._ctx.backward(t0.grad.data)
+        # The backward functions return TensorData, so we wrap it directly instead of going through Tensor.__init__
         grads = [
-            Tensor(g, requires_grad=False) if g is not None else None
+            Tensor._from_data(g, requires_grad=False) if g is not None else None
             for g in ([grads] if len(t0._ctx.parents) == 1 else grads)
         ]
 
@@ -118,10 +121,17 @@ def backward(tensor: Tensor) -> Tensor:
                 that gradients accumulate correctly in cases of branched computations.
 
                 """
-                parent.grad = grad if parent.grad is None else (parent.grad + grad)
-
-        # Clean up to prevent memory leaks
-        del t0._ctx
+                if parent.grad is None:
+                    parent.grad = grad
+                else:
+                    # Gradients are constants w.r.t. the graph, so we add them with the low-level op directly
+                    parent.grad = Tensor._from_data(
+                        parent.grad.data.elementwise(BinaryOps.ADD, grad.data), requires_grad=False
+                    )
+
+        # Release the context right away. It holds the parents and the data saved for the backward pass, so dropping it
+        # frees the forward intermediates of this node during the sweep instead of when the graph goes out of scope.
+        t0._ctx = None
 
     """
     The process concludes when all tensors in the graph have had their gradients computed
@@ -84,6 +84,7 @@ class TensorData:
             UnaryOps.EXP2: lambda x: np.exp2(x).astype(dtypes.only_float.np),
             UnaryOps.LOG2: lambda x: np.log2(x).astype(dtypes.only_float.np),
             UnaryOps.SIN: lambda x: np.sin(x).astype(dtypes.only_float.np),
+            UnaryOps.COS: lambda x: np.cos(x).astype(dtypes.only_float.np),
             UnaryOps.SQRT: lambda x: np.sqrt(x).astype(dtypes.only_float.np),
         }
         binary_ops = {
@@ -93,6 +94,9 @@ class TensorData:
             BinaryOps.DIV: lambda x, y: np.divide(x, y).astype(dtypes.only_float.np),
             BinaryOps.MAX: lambda x, y: np.maximum(x, y).astype(dtypes.only_float.np),
             BinaryOps.CMPLT: lambda x, y: np.less(x, y).astype(np.bool_),
+            BinaryOps.CMPGE: lambda x, y: np.greater_equal(x, y).astype(dtypes.only_float.np),
+            BinaryOps.CMPEQ: lambda x, y: np.equal(x, y).astype(dtypes.only_float.np),
+            BinaryOps.CMPNE: lambda x, y: np.not_equal(x, y).astype(dtypes.only_float.np),
         }
         ternary_ops = {
             TernaryOps.WHERE: lambda x, y, z: np.where(x, y, z).astype(dtypes.only_float.np),
@@ -122,6 +126,16 @@ class TensorData:
         else:
             raise NotImplementedError(op)
 
+    def matmul(self, y: "TensorData"):
+        """Perform a (batched) matrix multiplication with another TensorData of matching batch dimensions."""
+        return TensorData(np.matmul(self.data, y.data).astype(dtypes.only_float.np))
+
+    def cumsum(self, axis: int):
+        """Compute the cumulative sum of the data along an axis, keeping the dtype like a sum reduction."""
+        # a running sum over bools is a count, so they accumulate in float instead of as a logical or
+        dtype = dtypes.only_float.np if self.data.dtype == np.bool_ else self.data.dtype
+        return TensorData(np.cumsum(self.data, axis, dtype=dtype))
+
     # ------------------------------------------------------------------------------------------------------------------
     # movement operations
     def reshape(self, arg):
@@ -5,6 +5,7 @@ For simplicity we only use bool, int32 and float32. Note that after applying ope
 
 """
 from typing import ClassVar, Dict, Optional, Final
+import functools
 import numpy as np
 from dataclasses import dataclass
 
@@ -39,11 +40,16 @@ class dtypes:
     @staticmethod
     def is_float(x: DType) -> bool:
         """Check if a data type is a float type."""
-        return x in (dtypes.float32)
+        return x in (dtypes.float32,)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def from_np(x) -> DType:
-        """Convert a numpy data type to a DType."""
+        """Convert a numpy data type to a DType.
+
+        The result is cached because every Tensor construction looks up its dtype and `np.dtype(x).name` is slow.
+
+        """
         return DTYPES_DICT[np.dtype(x).name]
 
     @staticmethod
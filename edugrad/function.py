@@ -133,12 +133,16 @@ class Sin(Function):
         return x.elementwise(UnaryOps.SIN)
 
     def backward(self, grad: TensorData) -> TensorData:
-        return (
-            self.x.const(math.pi / 2)
-            .elementwise(BinaryOps.SUB, self.x)
-            .elementwise(UnaryOps.SIN)
-            .elementwise(BinaryOps.MUL, grad)
-        )
+        return self.x.elementwise(UnaryOps.COS).elementwise(BinaryOps.MUL, grad)
+
+
+class Cos(Function):
+    def forward(self, x: TensorData) -> TensorData:
+        self.x = x
+        return x.elementwise(UnaryOps.COS)
+
+    def backward(self, grad: TensorData) -> TensorData:
+        return self.x.elementwise(UnaryOps.SIN).elementwise(UnaryOps.NEG).elementwise(BinaryOps.MUL, grad)
 
 
 class Relu(Function):
@@ -205,6 +209,22 @@ class Less(Function):
         return x.elementwise(BinaryOps.CMPLT, y)
 
 
+# NOTE: unlike Less, these comparisons return float32 masks that can be summed or averaged directly
+class GreaterEqual(Function):
+    def forward(self, x: TensorData, y: TensorData) -> TensorData:
+        return x.elementwise(BinaryOps.CMPGE, y)
+
+
+class Equal(Function):
+    def forward(self, x: TensorData, y: TensorData) -> TensorData:
+        return x.elementwise(BinaryOps.CMPEQ, y)
+
+
+class NotEqual(Function):
+    def forward(self, x: TensorData, y: TensorData) -> TensorData:
+        return x.elementwise(BinaryOps.CMPNE, y)
+
+
 class Add(Function):
     def forward(self, x: TensorData, y: TensorData) -> TensorData:
         return x.elementwise(BinaryOps.ADD, y)
@@ -252,6 +272,20 @@ class Div(Function):
         )
 
 
+class MatMul(Function):
+    def forward(self, x: TensorData, y: TensorData) -> TensorData:
+        self.x, self.y = x, y
+        return x.matmul(y)
+
+    def backward(self, grad_output: TensorData) -> Tuple[Optional[TensorData], Optional[TensorData]]:
+        # swap the two matrix dimensions and keep the batch dimensions in place
+        order = (*range(len(grad_output.shape) - 2), len(grad_output.shape) - 1, len(grad_output.shape) - 2)
+        return (
+            grad_output.matmul(self.y.permute(order)) if self.needs_input_grad[0] else None,
+            self.x.permute(order).matmul(grad_output) if self.needs_input_grad[1] else None,
+        )
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 # ternary ops
 
@@ -302,6 +336,18 @@ class Max(Function):
         return max_is_1s.elementwise(BinaryOps.DIV, div).elementwise(BinaryOps.MUL, grad_output.expand(self.x.shape))
 
 
+class CumSum(Function):
+    def forward(self, x: TensorData, axis: int) -> TensorData:
+        assert len(x.shape) > 0, "cumsum needs at least one dimension"
+        self.axis = axis if axis >= 0 else axis + len(x.shape)
+        return x.cumsum(self.axis)
+
+    def backward(self, grad_output: TensorData) -> TensorData:
+        # the gradient of a prefix sum is the suffix sum of the incoming gradient
+        arg = tuple([-1 if i == self.axis else 1 for i in range(len(grad_output.shape))])
+        return grad_output.stride(arg).cumsum(self.axis).stride(arg)
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 # movement ops
 
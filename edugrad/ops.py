@@ -13,11 +13,15 @@ Operation Types:
 - LoadOps: Related to loading or initializing tensor data, creating tensors from various sources or with specific
     initialization patterns.
 
+Not every low-level op is enumerated here: TensorData.matmul and TensorData.cumsum have no entry and are called directly
+as methods, so another backend has to implement them in addition to the ops above.
+
 """
 from collections import namedtuple
 
-UnaryOps = namedtuple("UnaryOps", ["NOOP", "EXP2", "LOG2", "CAST", "SIN", "SQRT", "RECIP", "NEG"])
-BinaryOps = namedtuple("BinaryOps", ["ADD", "SUB", "MUL", "DIV", "MAX", "MOD", "CMPLT"])
+UnaryOps = namedtuple("UnaryOps", ["NOOP", "EXP2", "LOG2", "CAST", "SIN", "COS", "SQRT", "RECIP", "NEG"])
+# CMPLT returns a bool mask, while CMPGE, CMPEQ and CMPNE return float32 masks that can be summed or averaged directly
+BinaryOps = namedtuple("BinaryOps", ["ADD", "SUB", "MUL", "DIV", "MAX", "MOD", "CMPLT", "CMPGE", "CMPEQ", "CMPNE"])
 TernaryOps = namedtuple("TernaryOps", ["MULACC", "WHERE"])
 ReduceOps = namedtuple("ReduceOps", ["SUM", "MAX"])
 MovementOps = namedtuple("MovementOps", ["RESHAPE", "PERMUTE", "EXPAND", "PAD", "SHRINK", "STRIDE"])
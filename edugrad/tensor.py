@@ -10,17 +10,17 @@ The high-level ops support many things that you could expect from a tensor libra
 # inspired by https://github.com/karpathy/micrograd/blob/master/micrograd/engine.py
 from __future__ import annotations
 import time
-import math
 from typing import ClassVar, Sequence, Any
 
 import numpy as np
 
 from edugrad.dtypes import DType, dtypes, DTYPES_DICT
-from edugrad.helpers import getenv, DEBUG, prod, all_int, round_up, shape_int
+from edugrad.helpers import getenv, DEBUG, prod, all_int, shape_int
 from edugrad.data import TensorData
 from edugrad.ops import LoadOps
-from edugrad.function import Function
-import edugrad.function as function
+# bind the functions once at import so that each op dispatch skips the module attribute lookup
+from edugrad.function import Function, Cast, Neg, Log, Exp, Relu, Sigmoid, Sqrt, Sin, Cos, MatMul, CumSum
+from edugrad.function import Less, GreaterEqual, Equal, NotEqual
 from edugrad.autograd import backward, collect_backward_graph
 
 # fmt: off
@@ -35,9 +35,12 @@ from edugrad._tensor.tensor_broadcasted_binary_mlops import _broadcasted, _to_fl
 from edugrad._tensor.tensor_reduce import _reduce, tsum, tmax, tmin, mean, std, _softmax, softmax, log_softmax, argmax, argmin
 # fmt: on
 
+# environment flags do not change during a run, so we read them once instead of in every in-place op
+_DISALLOW_ASSIGN = bool(getenv("DISALLOW_ASSIGN"))
+
 
 class Tensor:
-    __slots__ = "data", "requires_grad", "grad", "_ctx"
+    __slots__ = "data", "requires_grad", "grad", "_ctx", "shape", "dtype", "ndim"
     __deletable__ = ("_ctx",)
     training: ClassVar[bool] = False
 
@@ -101,23 +104,28 @@ class Tensor:
             raise RuntimeError(f"can't create Tensor from {data!r} with type {type(data)}")
         self.data = data
 
+        # TensorData is immutable after construction, so we cache its metadata instead of reading it on every access
+        self.shape: tuple[shape_int, ...] = data.shape
+        self.dtype: DType = data.dtype
+        self.ndim: int = len(data.shape)
+
+    @classmethod
+    def _from_data(cls, data: TensorData, requires_grad: bool | None = None) -> Tensor:
+        """Wraps existing TensorData without going through the input type dispatch of __init__."""
+        t = cls.__new__(cls)
+        t.data, t.grad, t.requires_grad, t._ctx = data, None, requires_grad, None
+        t.shape, t.dtype, t.ndim = data.shape, data.dtype, len(data.shape)
+        return t
+
     # ------------------------------------------------------------------------------------------------------------------
     # basic properties
 
     def __repr__(self):
         return f"<Tensor {self.data!r} with grad {(self.grad.data if self.grad else None)!r}>"
 
-    # Python has a non moving garbage collector, so this should be okay
-    def __hash__(self):
-        return id(self)
-
-    @property
-    def shape(self) -> tuple[shape_int, ...]:
-        return self.data.shape
-
-    @property
-    def dtype(self) -> DType:
-        return self.data.dtype
+    # Python has a non moving garbage collector, so this should be okay. We reuse the identity hash of object, which is
+    # implemented in C and skips the Python frame of a __hash__ method. It is needed because __eq__ is overloaded.
+    __hash__ = object.__hash__
 
     # ------------------------------------------------------------------------------------------------------------------
     # data handlers
@@ -139,22 +147,27 @@ class Tensor:
             print(f"assign {self.data} <- {x.data}")
 
         # If dtype matches and assignment is allowed, perform the assignment
-        if self.dtype == x.dtype and self.data is not None and not getenv("DISALLOW_ASSIGN"):
+        if self.dtype == x.dtype and self.data is not None and not _DISALLOW_ASSIGN:
             x.data.output_buffer = self.data
 
         self.data = x.data
+        self.shape, self.dtype, self.ndim = x.shape, x.dtype, x.ndim
         return self
 
     # ------------------------------------------------------------------------------------------------------------------
     # basic tensor manipulations
 
     def detach(self) -> Tensor:
-        return Tensor(self.data, requires_grad=False)
+        return Tensor._from_data(self.data, requires_grad=False)
 
     def numpy(self) -> np.ndarray:
         assert all_int(self.shape), f"no numpy if shape is symbolic, {self.shape=}"
         assert self.dtype.np is not None, f"no numpy dtype for {self.dtype}"
-        return self.detach().cast(dtypes.from_np(self.dtype.np)).data.data.reshape(self.shape)
+        # .numpy() is a leaf read, so we skip the detach/cast round trip if the buffer can be handed out as is
+        arr = self.data.data
+        if arr.shape == self.shape and arr.dtype == self.dtype.np:
+            return arr
+        return arr.astype(self.dtype.np).reshape(self.shape)
 
     def item(self) -> float | int:
         return self.numpy().item()
@@ -229,11 +242,13 @@ class Tensor:
         # Generate uniform random samples
         unif_samples = Tensor.rand(num_samples, cdf.shape[0], 1)
 
-        # Determine indices based on CDF
-        indices = (unif_samples.expand((-1, -1, cdf.shape[1])) >= cdf).sum(2).permute((1, 0))
+        # Determine indices based on CDF, i.e. count the CDF values each sample has passed with a per-row binary search
+        cdf_np, unif_np = cdf.numpy(), unif_samples.numpy()[..., 0]
+        indices = np.stack([np.searchsorted(c, u, side="right") for c, u in zip(cdf_np, unif_np.T)])
+        indices = Tensor(indices, dtype=dtypes.int32)
 
         # If the original tensor was 1D, squeeze the resulting indices tensor
-        return (indices.squeeze(0) if self.ndim == 1 else indices).cast(dtypes.int32)
+        return indices.squeeze(0) if self.ndim == 1 else indices
 
     # ------------------------------------------------------------------------------------------------------------------
     # tensor_autograd.py
@@ -254,7 +269,7 @@ class Tensor:
     # (padding_left, padding_right, padding_top, padding_bottom)
     def pad2d(self, padding:list[int] | tuple[int, ...], value:float=0) -> Tensor: return pad2d(self, padding, value)
     def shrink(self, arg:tuple[tuple[shape_int, shape_int] | None, ...]) -> Tensor: return shrink(self, arg)
-    def squeeze(self, dim=None) -> Tensor: squeeze(self, dim)
+    def squeeze(self, dim=None) -> Tensor: return squeeze(self, dim)
     def unsqueeze(self, dim) -> Tensor: return unsqueeze(self, dim)
 
     @property
@@ -326,34 +341,29 @@ class Tensor:
         n1, n2 = len(self.shape), len(w.shape)
         assert n1 != 0 and n2 != 0, f"both arguments to matmul need to be at least 1D, but they are {n1}D and {n2}D"
         assert self.shape[-1] == w.shape[-min(n2, 2)], f"Input Tensor shapes {self.shape} and {w.shape} cannot be multiplied ({self.shape[-1]} != {w.shape[-min(n2, 2)]})"
-        x = self.reshape(*self.shape[0:-1], *[1]*min(n1-1, n2-1, 1), self.shape[-1])
-        w = w.reshape(*w.shape[0:-2], *[1]*min(n1-1, n2-1, 1), *w.shape[-min(n2, 2):]).transpose(-1, -min(n2, 2))
-        return (x*w).sum(-1)
-
-    def _cumsum(self, axis:int=0, _first_zero=False) -> Tensor: return self.transpose(axis,-1).pad2d((self.shape[axis]-int(not _first_zero),0))._pool((self.shape[axis],)).sum(-1).transpose(axis,-1)
-    def cumsum(self, axis:int=0) -> Tensor:
-        # TODO: someday the optimizer will find this on it's own
-        # for now this is a two stage cumsum
-        SPLIT = 256
-        if self.shape[axis] <= SPLIT*2:
-            return self._cumsum(axis)
-        ret = self.transpose(axis,-1).pad2d((round_up(self.shape[axis], SPLIT)-self.shape[axis], 0))
-        ret = ret.reshape(*ret.shape[0:-1], ret.shape[-1]//SPLIT, SPLIT)._cumsum(-1)
-        base_add = ret[..., -1]._cumsum(-1, _first_zero=True)[..., :-1]
-        base_add = base_add.unsqueeze(-1).expand(*base_add.shape, ret.shape[-1])
-        def fix(x:Tensor): return x.reshape(*ret.shape[0:-2], ret.shape[-2] * ret.shape[-1])[..., -self.shape[axis]:].transpose(axis,-1)
-        return fix(ret) + fix(base_add)
+        # promote vectors to matrices and broadcast the batch dimensions, so that MatMul only sees (..., M, K) @ (..., K, N)
+        x = self.reshape(1, self.shape[0]) if n1 == 1 else self
+        y = w.reshape(w.shape[0], 1) if n2 == 1 else w
+        batch = tuple(np.broadcast_shapes(x.shape[:-2], y.shape[:-2]))
+        if x.shape[:-2] != batch: x = x.reshape(*[1]*(len(batch)-len(x.shape[:-2])), *x.shape).expand(*batch, *x.shape[-2:])
+        if y.shape[:-2] != batch: y = y.reshape(*[1]*(len(batch)-len(y.shape[:-2])), *y.shape).expand(*batch, *y.shape[-2:])
+        ret = MatMul.apply(x, y)
+        # drop the dimensions that were added to the vectors again
+        shape = (*batch, *self.shape[-2:-1], *w.shape[-1:]) if n2 > 1 else (*batch, *self.shape[-2:-1])
+        return ret if ret.shape == shape else ret.reshape(shape)
+
+    def cumsum(self, axis:int=0) -> Tensor: return CumSum.apply(self, axis=axis)
 
     # mlops (unary)
 
-    def neg(self): return function.Neg.apply(self)
-    def log(self): return function.Log.apply(self)
-    def exp(self): return function.Exp.apply(self)
-    def relu(self): return function.Relu.apply(self)
-    def sigmoid(self): return function.Sigmoid.apply(self)
-    def sqrt(self): return function.Sqrt.apply(self)
-    def sin(self): return function.Sin.apply(self)
-    def cos(self): return ((math.pi/2)-self).sin()
+    def neg(self): return Neg.apply(self)
+    def log(self): return Log.apply(self)
+    def exp(self): return Exp.apply(self)
+    def relu(self): return Relu.apply(self)
+    def sigmoid(self): return Sigmoid.apply(self)
+    def sqrt(self): return Sqrt.apply(self)
+    def sin(self): return Sin.apply(self)
+    def cos(self): return Cos.apply(self)
 
     # math functions (unary) skipped
 
@@ -405,12 +415,12 @@ class Tensor:
     def __itruediv__(self, x) -> Tensor: return self.assign(self.div(x))
     def __imatmul__(self, x) -> Tensor: return self.assign(self.matmul(x))
 
-    def __lt__(self, x) -> Tensor: return function.Less.apply(*self._broadcasted(x, False))
-    def __gt__(self, x) -> Tensor: return function.Less.apply(*self._broadcasted(x, True))
-    def __ge__(self, x) -> Tensor: return 1.0-(self<x)
-    def __le__(self, x) -> Tensor: return 1.0-(self>x)
-    def __ne__(self, x) -> Tensor: return (self<x) + (self>x)     # type: ignore
-    def __eq__(self, x) -> Tensor: return 1.0-(self != x)             # type: ignore
+    def __lt__(self, x) -> Tensor: return Less.apply(*self._broadcasted(x, False))
+    def __gt__(self, x) -> Tensor: return Less.apply(*self._broadcasted(x, True))
+    def __ge__(self, x) -> Tensor: return GreaterEqual.apply(*self._broadcasted(x, False))
+    def __le__(self, x) -> Tensor: return GreaterEqual.apply(*self._broadcasted(x, True))
+    def __ne__(self, x) -> Tensor: return NotEqual.apply(*self._broadcasted(x, False))     # type: ignore
+    def __eq__(self, x) -> Tensor: return Equal.apply(*self._broadcasted(x, False))        # type: ignore
 
     # functional nn ops
 
@@ -425,17 +435,20 @@ class Tensor:
 
     # cast ops
 
-    def cast(self, dtype:DType) -> Tensor: return function.Cast.apply(self, dtype=dtype) if self.dtype != dtype else self
+    # NOTE: chained casts are not folded into one. Every cast between bool, int32 and float32 can lose information, so
+    # x.cast(a).cast(b) is not x.cast(b) in general, and the Cast context is only kept when a gradient is required.
+    def cast(self, dtype:DType) -> Tensor: return Cast.apply(self, dtype=dtype) if self.dtype != dtype else self
     def bitcast(self, dtype:DType) -> Tensor:
         assert self.dtype.itemsize == dtype.itemsize, "can't bitcast mismatched dtype itemsizes"
-        return function.Cast.apply(self, dtype=dtype, bitcast=True) if self.dtype != dtype else self
+        if self.dtype == dtype: return self
+        # without a gradient there is no graph node to build and a bitcast is only a view of the same buffer
+        if not self.requires_grad: return Tensor._from_data(self.data.cast(dtype, bitcast=True), self.requires_grad)
+        return Cast.apply(self, dtype=dtype, bitcast=True)
     def float(self) -> Tensor: return self.cast(dtypes.float32)
     def half(self) -> Tensor: return self.cast(dtypes.float16)
 
     # convenience stuff
 
-    @property
-    def ndim(self) -> int: return len(self.shape)
     def numel(self) -> shape_int: return prod(self.shape)
     def element_size(self) -> int: return self.dtype.itemsize
     def nbytes(self) -> int: return self.numel() * self.element_size()
@@ -1,15 +1,22 @@
 import numpy as np
-import torch
 import unittest
 from edugrad import Tensor
 
 from tests.gradcheck import numerical_jacobian, jacobian, gradcheck
 
-x_init = np.random.randn(1, 3).astype(np.float32)
-U_init = np.random.randn(3, 3).astype(np.float32)
-V_init = np.random.randn(3, 3).astype(np.float32)
-W_init = np.random.randn(3, 3).astype(np.float32)
-m_init = np.random.randn(1, 3).astype(np.float32)
+# a seeded generator that samples float32 directly, so the inputs are reproducible and need no cast
+rng = np.random.default_rng(0)
+x_init = rng.standard_normal((1, 3), dtype=np.float32)
+U_init = rng.standard_normal((3, 3), dtype=np.float32)
+V_init = rng.standard_normal((3, 3), dtype=np.float32)
+W_init = rng.standard_normal((3, 3), dtype=np.float32)
+m_init = rng.standard_normal((1, 3), dtype=np.float32)
+
+# fixed inputs of the jacobian and gradient checks
+jacobian_W_init = np.random.RandomState(42069).random((10, 5)).astype(np.float32)
+jacobian_x_init = np.random.RandomState(69420).random((1, 10)).astype(np.float32)
+gradcheck_W_init = np.random.RandomState(1337).random((10, 5)).astype(np.float32)
+gradcheck_x_init = np.random.RandomState(7331).random((1, 10)).astype(np.float32)
 
 
 class TestEdugrad(unittest.TestCase):
@@ -25,6 +32,8 @@ class TestEdugrad(unittest.TestCase):
             return out.numpy(), x.grad.numpy(), W.grad.numpy()
 
         def test_pytorch():
+            import torch  # imported lazily because loading torch is slow and only the comparison tests need it
+
             x = torch.tensor(x_init, requires_grad=True)
             W = torch.tensor(W_init, requires_grad=True)
             m = torch.tensor(m_init)
@@ -51,6 +60,8 @@ class TestEdugrad(unittest.TestCase):
             return out.numpy(), u.grad.numpy(), v.grad.numpy(), w.grad.numpy()
 
         def test_pytorch():
+            import torch
+
             u = torch.tensor(U_init, requires_grad=True)
             v = torch.tensor(V_init, requires_grad=True)
             w = torch.tensor(W_init, requires_grad=True)
@@ -65,6 +76,71 @@ class TestEdugrad(unittest.TestCase):
         for x, y in zip(test_edugrad(), test_pytorch()):
             np.testing.assert_allclose(x, y, atol=1e-5)
 
+    def test_cumsum_backward(self):
+        def test_edugrad():
+            u = Tensor(U_init, requires_grad=True)
+            w = Tensor(W_init, requires_grad=True)
+            out = u.cumsum(1).mul(w).sum()
+            out.backward()
+            return out.numpy(), u.grad.numpy(), w.grad.numpy()
+
+        def test_pytorch():
+            import torch
+
+            u = torch.tensor(U_init, requires_grad=True)
+            w = torch.tensor(W_init, requires_grad=True)
+            out = u.cumsum(1).mul(w).sum()
+            out.backward()
+            return out.detach().numpy(), u.grad, w.grad
+
+        for x, y in zip(test_edugrad(), test_pytorch()):
+            np.testing.assert_allclose(x, y, atol=1e-5)
+
+    def test_trigonometric_backward(self):
+        def test_edugrad():
+            u = Tensor(U_init, requires_grad=True)
+            out = u.sin().mul(u.cos()).sum()
+            out.backward()
+            return out.numpy(), u.grad.numpy()
+
+        def test_pytorch():
+            import torch
+
+            u = torch.tensor(U_init, requires_grad=True)
+            out = u.sin().mul(u.cos()).sum()
+            out.backward()
+            return out.detach().numpy(), u.grad
+
+        for x, y in zip(test_edugrad(), test_pytorch()):
+            np.testing.assert_allclose(x, y, atol=1e-5)
+
+    def test_dot_backward(self):
+        # vector-vector, vector-matrix, matrix-vector and broadcast batch shapes
+        shapes = [((3,), (3,)), ((3,), (2, 3, 4)), ((2, 4, 3), (3,)), ((2, 1, 4, 3), (5, 3, 2)), ((4, 3), (2, 3, 2))]
+        dot_rng = np.random.default_rng(1)
+        for a_shape, b_shape in shapes:
+            a_init = dot_rng.standard_normal(a_shape, dtype=np.float32)
+            b_init = dot_rng.standard_normal(b_shape, dtype=np.float32)
+
+            def test_edugrad():
+                a = Tensor(a_init, requires_grad=True)
+                b = Tensor(b_init, requires_grad=True)
+                out = a.dot(b)
+                out.sin().sum().backward()
+                return out.numpy(), a.grad.numpy(), b.grad.numpy()
+
+            def test_pytorch():
+                import torch
+
+                a = torch.tensor(a_init, requires_grad=True)
+                b = torch.tensor(b_init, requires_grad=True)
+                out = a.matmul(b)
+                out.sin().sum().backward()
+                return out.detach().numpy(), a.grad, b.grad
+
+            for x, y in zip(test_edugrad(), test_pytorch()):
+                np.testing.assert_allclose(x, y, atol=1e-5, err_msg=f"{a_shape} @ {b_shape}")
+
     def test_nograd(self):
         x = Tensor(x_init, requires_grad=False)
         m = Tensor(m_init, requires_grad=False)
@@ -81,8 +157,9 @@ class TestEdugrad(unittest.TestCase):
         assert W.grad is not None
 
     def test_jacobian(self):
-        W = np.random.RandomState(42069).random((10, 5)).astype(np.float32)
-        x = np.random.RandomState(69420).random((1, 10)).astype(np.float32)
+        import torch
+
+        W, x = jacobian_W_init, jacobian_x_init
 
         torch_x = torch.tensor(x, requires_grad=True)
         torch_W = torch.tensor(W, requires_grad=True)
@@ -105,8 +182,7 @@ class TestEdugrad(unittest.TestCase):
         np.testing.assert_allclose(PJ, NJ, atol=1e-3)
 
     def test_gradcheck(self):
-        W = np.random.RandomState(1337).random((10, 5)).astype(np.float32)
-        x = np.random.RandomState(7331).random((1, 10)).astype(np.float32)
+        W, x = gradcheck_W_init, gradcheck_x_init
 
         edugrad_x = Tensor(x, requires_grad=True)
         edugrad_W = Tensor(W, requires_grad=True)
@@ -4,26 +4,18 @@ from edugrad import Tensor
 
 class TestEdugrad(unittest.TestCase):
     def test_argfix(self):
-        self.assertEqual(Tensor.zeros().shape, ())
-        self.assertEqual(Tensor.ones().shape, ())
-
-        self.assertEqual(Tensor.zeros([]).shape, ())
-        self.assertEqual(Tensor.ones([]).shape, ())
-
-        self.assertEqual(Tensor.zeros(tuple()).shape, ())
-        self.assertEqual(Tensor.ones(tuple()).shape, ())
-
-        self.assertEqual(Tensor.zeros(1).shape, (1,))
-        self.assertEqual(Tensor.ones(1).shape, (1,))
-
-        self.assertEqual(Tensor.zeros(1, 10, 20).shape, (1, 10, 20))
-        self.assertEqual(Tensor.ones(1, 10, 20).shape, (1, 10, 20))
-
-        self.assertEqual(Tensor.zeros([1]).shape, (1,))
-        self.assertEqual(Tensor.ones([1]).shape, (1,))
-
-        self.assertEqual(Tensor.zeros([10, 20, 40]).shape, (10, 20, 40))
-        self.assertEqual(Tensor.ones([10, 20, 40]).shape, (10, 20, 40))
+        cases = [
+            ((), ()),
+            (([],), ()),
+            ((tuple(),), ()),
+            ((1,), (1,)),
+            ((1, 10, 20), (1, 10, 20)),
+            (([1],), (1,)),
+            (([10, 20, 40],), (10, 20, 40)),
+        ]
+        for args, shape in cases:
+            self.assertEqual(Tensor.zeros(*args).shape, shape)
+            self.assertEqual(Tensor.ones(*args).shape, shape)
 
         self.assertEqual(Tensor.rand(1, 10, 20).shape, (1, 10, 20))
         self.assertEqual(Tensor.rand((10, 20, 40)).shape, (10, 20, 40))
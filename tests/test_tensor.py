@@ -2,6 +2,7 @@ import numpy as np
 import unittest, copy
 from edugrad import Tensor
 from edugrad.dtypes import dtypes
+from edugrad.function import Cast
 
 
 # Tensor(x) casts all types up to float32
@@ -20,7 +21,7 @@ class TestEdugrad(unittest.TestCase):
         assert Tensor.randn(1, 0, 2, 5).numel() == 0
 
     def test_element_size(self):
-        for _, dtype in dtypes.fields().items():
+        for dtype in dtypes.fields().values():
             assert (
                 dtype.itemsize == Tensor.randn(3, dtype=dtype).element_size()
             ), f"Tensor.element_size() not matching Tensor.dtype.itemsize for {dtype}"
@@ -94,20 +95,34 @@ class TestEdugrad(unittest.TestCase):
 
     def test_tensor_list_errors(self):
         # inhomogeneous shape
-        with self.assertRaises(ValueError):
-            Tensor([[], [[]]])
-        with self.assertRaises(ValueError):
-            Tensor([[1], []])
-        with self.assertRaises(ValueError):
-            Tensor([[1], [1], 1])
-        with self.assertRaises(ValueError):
-            Tensor([[[1, 1, 1], [1, 1]]])
-        with self.assertRaises(ValueError):
-            Tensor([[1, 1, 1], [[1, 1, 1]]])
+        for arr in ([[], [[]]], [[1], []], [[1], [1], 1], [[[1, 1, 1], [1, 1]]], [[1, 1, 1], [[1, 1, 1]]]):
+            with self.assertRaises(ValueError, msg=f"{arr}"):
+                Tensor(arr)
+        # out of range for the requested dtype
+        with self.assertRaises(OverflowError):
+            Tensor([2**40], dtype=dtypes.int32)
 
     def test_tensor_copy(self):
-        x = copy.deepcopy(Tensor.ones((3, 3, 3)))
-        np.testing.assert_allclose(x.numpy(), np.ones((3, 3, 3)))
+        src = Tensor.ones((3, 3, 3))
+        x = copy.deepcopy(src)
+        assert not np.shares_memory(x.numpy(), src.numpy()), "deepcopy must not share the buffer"
+        np.testing.assert_array_equal(x.numpy(), np.ones((3, 3, 3)))
+
+        # explicit copy through the numpy buffer, which skips deepcopy's reduce protocol
+        y = Tensor(x.numpy().copy())
+        assert not np.shares_memory(y.numpy(), x.numpy()), "copy must not share the buffer"
+        np.testing.assert_array_equal(y.numpy(), x.numpy())
+
+    def test_bitcast(self):
+        a = Tensor([1.0, 2.0]).bitcast(dtypes.int32)
+        assert a.dtype == dtypes.int32
+        assert not a.requires_grad and a._ctx is None
+        np.testing.assert_array_equal(a.numpy(), np.array([1.0, 2.0], dtype=np.float32).view(np.int32))
+
+        # with a gradient the bitcast still goes through Cast to become a graph node
+        b = Tensor([1.0, 2.0], requires_grad=True).bitcast(dtypes.int32)
+        assert isinstance(b._ctx, Cast)
+        np.testing.assert_array_equal(b.numpy(), a.numpy())
 
     def test_item_to_tensor_to_item(self):
         for a in [0, 1, 2, 3, -1, -100, 100, -101.1, 2.345, 100.1, True, False]:
@@ -135,21 +150,23 @@ class TestEdugrad(unittest.TestCase):
 class TestZeroShapeTensor(unittest.TestCase):
     def test_elementwise(self):
         a = Tensor.rand(3, 2, 0)
+        a_np = a.numpy()
         a_exp = a.exp()
         assert a_exp.shape == (3, 2, 0)
-        np.testing.assert_equal(a_exp.numpy(), np.exp(a.numpy()))
+        np.testing.assert_equal(a_exp.numpy(), np.exp(a_np))
 
         b = Tensor.rand(3, 2, 0)
+        b_np = b.numpy()
         assert b.shape == (3, 2, 0)
         ab = a * b
         assert ab.shape == (3, 2, 0)
-        np.testing.assert_equal(ab.numpy(), a.numpy() * b.numpy())
+        np.testing.assert_equal(ab.numpy(), a_np * b_np)
 
         mask = Tensor.rand(3, 2, 0) > 0.5
         assert mask.shape == (3, 2, 0)
         c = mask.where(a, b)
         assert c.shape == (3, 2, 0)
-        np.testing.assert_equal(c.numpy(), np.where(mask.numpy(), a.numpy(), b.numpy()))
+        np.testing.assert_equal(c.numpy(), np.where(mask.numpy(), a_np, b_np))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+import numpy as np
+import unittest
+from edugrad import Tensor
+from edugrad.dtypes import dtypes
+
+
+class TestBroadcastedOperands(unittest.TestCase):
+    def test_scalar_operand(self):
+        a = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+        t = Tensor(a)
+        np.testing.assert_allclose((t + 10.0).numpy(), a + 10.0)
+        np.testing.assert_allclose((1 - t).numpy(), 1 - a)
+        np.testing.assert_allclose((t * 2).numpy(), a * 2)
+        np.testing.assert_allclose((t / 2).numpy(), a / 2)
+        np.testing.assert_allclose(t.maximum(2.5).numpy(), np.maximum(a, 2.5))
+
+    def test_list_operand(self):
+        a = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+        t = Tensor(a)
+        np.testing.assert_allclose((t + [10.0, 20.0]).numpy(), a + [10.0, 20.0])
+        np.testing.assert_allclose(([10.0, 20.0] - t).numpy(), [10.0, 20.0] - a)
+        np.testing.assert_allclose(t.maximum([2.0, 2.0]).numpy(), np.maximum(a, [2.0, 2.0]))
+
+
+class TestComparisons(unittest.TestCase):
+    def test_comparisons_return_float_masks(self):
+        a = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+        b = np.array([1.0, 3.0, 2.0], dtype=np.float32)
+        x, y = Tensor(a), Tensor(b)
+        for out, expected in [(x >= y, a >= b), (x <= y, a <= b), (x == y, a == b), (x != y, a != b)]:
+            assert out.dtype == dtypes.float32
+            np.testing.assert_equal(out.numpy(), expected.astype(np.float32))
+        np.testing.assert_equal((x >= 2).numpy(), [0.0, 1.0, 1.0])
+        np.testing.assert_equal((2 <= x).numpy(), [0.0, 1.0, 1.0])
+
+    def test_comparisons_with_nan(self):
+        # like numpy, every comparison with nan is false except !=
+        x = Tensor([np.nan, 1.0])
+        np.testing.assert_equal((x == x).numpy(), [0.0, 1.0])
+        np.testing.assert_equal((x != x).numpy(), [1.0, 0.0])
+        np.testing.assert_equal((x >= 1).numpy(), [0.0, 1.0])
+        np.testing.assert_equal((x <= 1).numpy(), [0.0, 1.0])
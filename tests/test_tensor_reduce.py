@@ -1,6 +1,7 @@
 import numpy as np
 import unittest
 from edugrad import Tensor
+from edugrad.dtypes import dtypes
 
 
 class TestZeroShapeTensor(unittest.TestCase):
@@ -23,3 +24,21 @@ class TestZeroShapeTensor(unittest.TestCase):
         np.testing.assert_equal(Tensor([]).min().numpy(), float("inf"))
         np.testing.assert_equal(Tensor([]).sum().numpy(), 0)
         np.testing.assert_equal(Tensor([]).mean().numpy(), 0)
+
+
+class TestCumSum(unittest.TestCase):
+    def test_cumsum_keeps_dtype(self):
+        a = np.arange(1000, dtype=np.int32).reshape(2, 500)
+        for axis in (0, 1, -1):
+            out = Tensor(a).cumsum(axis)
+            assert out.dtype == dtypes.int32
+            np.testing.assert_equal(out.numpy(), np.cumsum(a, axis))
+
+    def test_cumsum_long(self):
+        a = np.ones(1030, dtype=np.float32)
+        out = Tensor(a).cumsum()
+        assert out.dtype == dtypes.float32
+        np.testing.assert_allclose(out.numpy(), np.cumsum(a))
+
+    def test_cumsum_bool_counts(self):
+        np.testing.assert_equal(Tensor([True, False, True]).cumsum().numpy(), [1.0, 1.0, 2.0])
@@ -4,8 +4,13 @@ from edugrad import Tensor
 
 
 class TestZeroShapeTensor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # movement ops return new tensors, so the tests can share one zero-volume input
+        cls.zero_volume = Tensor.rand(3, 2, 0)
+
     def test_reshape(self):
-        t = Tensor.zeros(3, 2, 0)
+        t = self.zero_volume
         a = t.reshape(7, 0)
         assert a.shape == (7, 0)
         np.testing.assert_equal(a.numpy(), np.zeros((7, 0)))
@@ -23,16 +28,16 @@ class TestZeroShapeTensor(unittest.TestCase):
             # np.testing.assert_equal(t.numpy(), np.full((6, 2, 0), 12))
 
     def test_pad(self):
-        t = Tensor.rand(3, 2, 0).pad((None, None, (1, 1)), 1)
+        t = self.zero_volume.pad((None, None, (1, 1)), 1)
         assert t.shape == (3, 2, 2)
         np.testing.assert_equal(t.numpy(), np.ones((3, 2, 2)))
 
         # torch does not support padding non-zero dim with 0-size. torch.nn.functional.pad(torch.zeros(3,2,0), [0,0,0,4,0,0])
-        t = Tensor.rand(3, 2, 0).pad((None, (1, 1), None), 1)
+        t = self.zero_volume.pad((None, (1, 1), None), 1)
         assert t.shape == (3, 4, 0)
         np.testing.assert_equal(t.numpy(), np.ones((3, 4, 0)))
 
-        t = Tensor.rand(3, 2, 0).pad(((1, 1), None, None), 1)
+        t = self.zero_volume.pad(((1, 1), None, None), 1)
         assert t.shape == (5, 2, 0)
         np.testing.assert_equal(t.numpy(), np.ones((5, 2, 0)))
 